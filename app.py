@@ -3,9 +3,11 @@
 # -------------------------------------------------------------
 # What this script does:
 # - Connects to the official BISE Sargodha result website
-# - Sends roll numbers one by one (in a given range)
+# - Sends many roll numbers at the same time (in a given range)
 # - Collects student name, roll number, and result (marks/fail/pass)
-# - Saves all the data in a neat PDF table
+# - Saves every result to a CSV file as soon as it arrives
+#   (if the script stops halfway, just run it again and it continues where it left off)
+# - Saves all the data in an Excel file (and, with --pdf, in a neat PDF table)
 #
 # Why this script is useful:
 # - When results are first announced, you can ONLY search by roll number.
@@ -14,146 +16,534 @@
 #
 # How to use:
 # 1. Change the `start_roll` and `end_roll` variables at the bottom to your desired roll numbers.
-# 2. Run the script. It will fetch results and save them in a PDF file.
+# 2. Run the script. It will fetch results, save them in a CSV file, and then in an Excel file.
+#    Run it as `python app.py --pdf` to also get a PDF file.
 # -------------------------------------------------------------
 
+import argparse                     # reads options like --pdf from the command line
+import csv                          # reads and writes simple spreadsheet (.csv) files
+import logging                      # shows progress messages
+import os                           # checks if files already exist
+import re                           # fast text pattern matching
+import threading                    # lets each worker keep its own tokens
+import time                         # keeps track of how old saved tokens are and how fast we send requests
+from html import unescape           # turns "&amp;" back into "&" etc.
+from urllib.parse import urlencode  # turns form fields into the text that is sent to the website
+from concurrent.futures import ThreadPoolExecutor  # runs many requests at the same time
+from datetime import timedelta      # lets us say "one day" for how long to keep cached pages
+
 import requests                     # lets us send requests to websites
-from bs4 import BeautifulSoup       # makes it easy to read and search HTML pages
+from requests.adapters import HTTPAdapter  # controls how many connections the session keeps open
+from urllib3.util.retry import Retry       # automatically retries requests that fail on the network
+from lxml import html               # fast HTML parser
+from lxml.etree import XPath        # lets us prepare searches once and reuse them
+import xlsxwriter                   # writes Excel (.xlsx) files
+
+try:
+    import requests_cache           # optional: saves result pages on disk (see make_session)
+except ImportError:
+    requests_cache = None
 
 # this is the website URL for results
+# (it is plain http://, so HTTP/2 is not possible here: clients like httpx only use HTTP/2 over https://)
 BASE = "http://119.159.230.2/biseresultday2/resultday.aspx"
 
+# the website always writes the fields we need the same simple way:
+#   <span id="LblName">ALI KHAN</span>
+#   <input type="hidden" name="__VIEWSTATE" id="__VIEWSTATE" value="..." />
+# so we can pick them straight out of the raw page bytes without parsing the HTML at all
+# (only the few matched pieces are turned into text, not the whole page)
+PATTERNS = {k: re.compile(rb'id="' + k.encode() + rb'"[^>]*>(.*?)</span>', re.S)
+            for k in ("LblErr", "LblName", "LblRollNo", "lblGazres")}
+PATTERNS["__VIEWSTATE"] = re.compile(rb'id="__VIEWSTATE"[^>]*value="([^"]*)"')
+PATTERNS["__EVENTVALIDATION"] = re.compile(rb'id="__EVENTVALIDATION"[^>]*value="([^"]*)"')
+
+# ready-made lxml searches for the same fields, used only if the page looks different than expected
+XP = {k: XPath(f"string(//*[@id='{k}'])") for k in ("LblErr", "LblName", "LblRollNo", "lblGazres")}
+XP["__VIEWSTATE"] = XPath("string(//input[@id='__VIEWSTATE']/@value)")
+XP["__EVENTVALIDATION"] = XPath("string(//input[@id='__EVENTVALIDATION']/@value)")
+
+# the form fields that are the same for every roll number
+# it simulates what happens when you fill in the form and press "Show Result"
+# (on result day the form only offers "Search by Roll No." and always shows ONE student,
+#  so there is no way to ask for a whole school or class in a single request)
+BASE_PAYLOAD = {
+    "__EVENTTARGET": "",
+    "__EVENTARGUMENT": "",
+    "RbtSearchType": "Search by Roll No.",  # tells the website we are searching by roll number
+    "BtnShowResults": "Show Result",        # simulates clicking the button
+}
+# these never change, so turn them into form text just once
+BASE_PAYLOAD_ENCODED = urlencode(BASE_PAYLOAD)
+FORM_HEADERS = {"Content-Type": "application/x-www-form-urlencoded"}
+
+# every result is saved in this file as soon as it arrives
+RESULTS_CSV = "bise_results.csv"
+CSV_FIELDS = ["Roll No", "Name", "Result", "Status", "Marks"]
+
+# finds the marks in a result like "Passed with 850 marks" (or "Obtained 850 marks")
+MARKS_RE = re.compile(r"(\d+)\s*marks\b", re.I)
+# finds the status in a result written exactly like "Passed with 850 marks"
+STATUS_RE = re.compile(r"^(.+?)\s+with\s+\d+\s*marks\b", re.I | re.S)
+
+# saved result pages are kept here (as bise_cache.sqlite) for this long
+CACHE_NAME = "bise_cache"
+CACHE_EXPIRE = timedelta(days=1)
+
+# how many seconds tokens from the empty result page can be reused without asking the website again
+TOKEN_TTL = 60
+
+# at most this many requests per second are sent to the website
+# (going faster gets us blocked or slowed down by the website, which ends up slower overall)
+RATE_LIMIT = 10
+
+# show a progress message after every this many roll numbers
+PROGRESS_EVERY = 50
+
+# how many roll numbers to fetch at the same time
+# (most of the time is spent waiting for the website, so a few workers help a lot)
+WORKERS = 16
+
+
+log = logging.getLogger("bise_scraper")
+
+
+# -------------------------------------------------------------
+# STEP 0: SET UP THE SESSION
+# -------------------------------------------------------------
+def is_good_result_page(response):
+    """
+    Tells the cache which result pages are worth saving: only pages that have new tokens
+    and a result (or an error message like "invalid roll number") on them.
+    """
+    page = response.content
+    return bool(
+        PATTERNS["__VIEWSTATE"].search(page)
+        and PATTERNS["__EVENTVALIDATION"].search(page)
+        and (PATTERNS["lblGazres"].search(page) or PATTERNS["LblErr"].search(page))
+    )
+
+
+def is_cached(session, payload):
+    """
+    Returns True if the result page for this payload is already saved in the cache
+    (and not expired), so it can be used without waiting for our turn to ask the website.
+    """
+    if not (requests_cache and isinstance(session, requests_cache.CachedSession)):
+        return False
+    request = session.prepare_request(requests.Request("POST", BASE, data=payload, headers=FORM_HEADERS))
+    cached = session.cache.get_response(session.cache.create_key(request))
+    return cached is not None and not cached.is_expired
+
+
+def make_session():
+    """
+    Creates a requests session that is set up once and shared by all workers:
+    - keeps connections open (requests does keep-alive and compressed pages by default),
+      so we don't reconnect for every roll number
+    - keeps one connection per worker, so no thread has to wait for a free one
+    - retries a few times if the connection drops or the server is briefly overloaded
+    - sends browser-like headers on every request
+    - if 'requests_cache' is installed, saves every good result page on disk for a day,
+      so running the script again for the same roll numbers doesn't ask the website again
+      (roll numbers already in bise_results.csv are skipped anyway, so this only
+       helps when that file was deleted, e.g. to build it again from scratch)
+    """
+    if requests_cache:
+        session = requests_cache.CachedSession(
+            CACHE_NAME,
+            backend="sqlite",
+            allowable_methods=("POST",),   # only cache result pages, not the empty page with the tokens
+            expire_after=CACHE_EXPIRE,
+            match_headers=False,
+            # the tokens change all the time, so only the roll number decides which saved page is used
+            ignored_parameters=["__VIEWSTATE", "__EVENTVALIDATION"],
+            # never save a page with rejected tokens, or the retry would just get it back
+            filter_fn=is_good_result_page,
+        )
+    else:
+        session = requests.Session()
+
+    retries = Retry(
+        total=3,
+        backoff_factor=0.3,                      # wait 0.3s, 0.6s, 1.2s between tries
+        status_forcelist=[502, 503, 504],        # "server busy" type errors
+        allowed_methods=frozenset({"GET", "POST"}),  # a result lookup is safe to send again
+    )
+    adapter = HTTPAdapter(pool_connections=WORKERS, pool_maxsize=WORKERS, max_retries=retries)
+    session.mount("http://", adapter)
+
+    # headers to make us look like a normal browser
+    session.headers.update({
+        "User-Agent": "Mozilla/5.0",
+        "Referer": BASE,
+    })
+    return session
+
+
+# a "token bucket": it holds up to RATE_LIMIT tickets and refills at RATE_LIMIT tickets per second,
+# every request has to take one ticket first
+_rate_bucket = {"tickets": float(RATE_LIMIT), "updated": time.monotonic()}
+_rate_bucket_lock = threading.Lock()
+
+def wait_for_turn():
+    """
+    Call this right before sending a request. It waits (if needed) so that all workers
+    together never send more than RATE_LIMIT requests per second.
+    """
+    while True:
+        with _rate_bucket_lock:
+            # put back the tickets that were refilled since last time
+            now = time.monotonic()
+            elapsed = now - _rate_bucket["updated"]
+            _rate_bucket["tickets"] = min(RATE_LIMIT, _rate_bucket["tickets"] + elapsed * RATE_LIMIT)
+            _rate_bucket["updated"] = now
+
+            if _rate_bucket["tickets"] >= 1:
+                _rate_bucket["tickets"] -= 1
+                return
+
+            # not enough tickets: work out how long until the next one is ready
+            wait = (1 - _rate_bucket["tickets"]) / RATE_LIMIT
+
+        time.sleep(wait)
+
 
 # -------------------------------------------------------------
 # STEP 1: GET THE TOKENS NEEDED TO TALK TO THE WEBSITE
 # -------------------------------------------------------------
-def get_tokens(session):
+def read_page(page):
     """
-    The result page uses hidden security fields called __VIEWSTATE and __EVENTVALIDATION.
-    Without these, the server will reject your request.
-    This function goes to the page, finds those tokens, and returns them.
+    Picks the fields we need out of a result page (the raw bytes of the response)
+    and returns them as a dictionary,
+    e.g. {"LblName": "ALI KHAN", "__VIEWSTATE": "...", ...}.
+    Fields that are not on the page are given as "".
+
+    The quick text patterns are tried first. If they miss the tokens, or a field
+    has extra HTML inside it, the page is parsed properly with lxml instead
+    (lxml reads the bytes directly and finds the character set from the page itself).
     """
-    # open the result page
-    r = session.get(BASE, timeout=20)
-    r.encoding = 'utf-8'  # make sure text is displayed correctly
+    fields = {}
+    for key, pattern in PATTERNS.items():
+        m = pattern.search(page)
+        fields[key] = unescape(m.group(1).decode("utf-8", "replace")).strip() if m else ""
+
+    # (an empty page has nothing to parse, so it just gives empty fields)
+    if page.strip() and (not fields["__VIEWSTATE"] or any("<" in value for value in fields.values())):
+        doc = html.fromstring(page)
+        fields = {key: xp(doc).strip() for key, xp in XP.items()}
+
+    return fields
 
-    # use BeautifulSoup to search through the page HTML
-    soup = BeautifulSoup(r.text, "lxml")
 
+def get_tokens(page):
+    """
+    The result page uses hidden security fields called __VIEWSTATE and __EVENTVALIDATION.
+    Without these, the server will reject your request.
+    This function takes the page (the raw bytes of the response), finds those tokens, and returns them.
+
+    The website sends NEW tokens back with every result page, so we can pass the
+    last result page here and reuse the tokens for the next roll number.
+    That way we only need to open the empty page once at the very start.
+    """
     # find the hidden fields by their ID
-    viewstate = soup.select_one("#__VIEWSTATE")["value"]
-    eventvalidation = soup.select_one("#__EVENTVALIDATION")["value"]
+    # (gives "" instead of crashing if a field is missing)
+    fields = read_page(page)
 
     # return them so they can be used in the next request
-    return viewstate, eventvalidation
+    return fields["__VIEWSTATE"], fields["__EVENTVALIDATION"]
+
+
+# remembers the last copy of the empty result page we downloaded,
+# so we can reuse its tokens for a while, and after that ask the server
+# "has it changed?" instead of downloading it again
+_token_page = {"etag": None, "last_modified": None, "tokens": None, "fetched_at": 0.0}
+_token_page_lock = threading.Lock()
+
+def fetch_start_tokens(session):
+    """
+    Opens the empty result page and returns its tokens
+    (raises an error if the page didn't have any).
+    Tokens fetched less than TOKEN_TTL seconds ago are simply reused without any request.
+    After that, the server is asked to only send the page if it changed
+    (If-None-Match / If-Modified-Since). When it answers "304 Not Modified",
+    the tokens we saved last time are used and nothing has to be downloaded or parsed.
+    """
+    with _token_page_lock:
+        if _token_page["tokens"] and time.time() - _token_page["fetched_at"] < TOKEN_TTL:
+            return _token_page["tokens"]
+
+        headers = {}
+        if _token_page["tokens"]:
+            if _token_page["etag"]:
+                headers["If-None-Match"] = _token_page["etag"]
+            if _token_page["last_modified"]:
+                headers["If-Modified-Since"] = _token_page["last_modified"]
+
+        wait_for_turn()
+        r = session.get(BASE, headers=headers, timeout=20)
+        if r.status_code == 304:
+            _token_page["fetched_at"] = time.time()
+            return _token_page["tokens"]
+
+        tokens = get_tokens(r.content)
+        if not all(tokens):
+            # don't save (and hand out) an empty pair of tokens, fail this request instead
+            raise RuntimeError(f"the result page had no tokens (HTTP {r.status_code})")
+
+        # save this copy for next time
+        _token_page["etag"] = r.headers.get("ETag")
+        _token_page["last_modified"] = r.headers.get("Last-Modified")
+        _token_page["tokens"] = tokens
+        _token_page["fetched_at"] = time.time()
+        return tokens
+
+
+def forget_start_tokens():
+    """
+    Throws away the saved tokens (for example when the website stopped accepting them),
+    so the next call to fetch_start_tokens downloads a fresh copy of the page.
+    """
+    with _token_page_lock:
+        _token_page.update(etag=None, last_modified=None, tokens=None, fetched_at=0.0)
 
 
 # -------------------------------------------------------------
 # STEP 2: FETCH RESULT FOR ONE ROLL NUMBER
 # -------------------------------------------------------------
-def fetch_one_roll(session, roll_no):
+def split_result(text):
+    """
+    Splits a result into its status and marks. Supported formats:
+    - "Passed with 850 marks"          -> ("Passed", 850)
+    - any other text with "<N> marks",
+      like "Total 1100, Obtained 850 marks" -> ("", 850)   (no clear status in it)
+    - text without marks, like "FAIL"  -> ("FAIL", None)
+    This is done once when the result arrives, so later steps (PDF, sorting, filtering)
+    can use the numbers straight away without searching the text again.
     """
-    Takes one roll number, sends it to the website, and extracts:
+    marks = MARKS_RE.search(text)
+    if not marks:
+        return text, None
+    status = STATUS_RE.match(text)
+    return (status.group(1) if status else ""), int(marks.group(1))
+
+
+def fetch_one_roll(session, roll_no, viewstate, eventvalidation):
+    """
+    Takes one roll number (and the current security tokens), sends it to the website, and extracts:
     - Student's Name
     - Student's Roll Number (as displayed on site)
     - Student's Result (marks, pass/fail, etc.)
     
     Returns a dictionary like:
     {"Roll No": "763130", "Name": "Ali Khan", "Result": "Passed with 850 marks"}
+    together with the fresh tokens from the response, to use for the next roll number.
+    If the website did not accept our tokens, the returned tokens are empty ("", "").
     """
     try:
-        # get the hidden security tokens for this request
-        viewstate, eventvalidation = get_tokens(session)
-
-        # this is the data we are "posting" to the website
-        # it simulates what happens when you fill in the form and press "Show Result"
-        payload = {
+        # this is the data we are "posting" to the website:
+        # the fixed form fields (already encoded) plus this request's tokens and roll number
+        payload = BASE_PAYLOAD_ENCODED + "&" + urlencode({
             "__VIEWSTATE": viewstate,
             "__EVENTVALIDATION": eventvalidation,
-            "__EVENTTARGET": "",
-            "__EVENTARGUMENT": "",
-            "RbtSearchType": "Search by Roll No.",  # tells the website we are searching by roll number
             "TxtSearchText": str(roll_no),          # this is the actual roll number we are searching for
-            "BtnShowResults": "Show Result",        # simulates clicking the button
-        }
+        })
 
-        # headers to make us look like a normal browser
-        headers = {
-            "User-Agent": "Mozilla/5.0",
-            "Referer": BASE
-        }
+        # send the data to the site (the browser headers are already set on the session)
+        # (pages that come from the cache don't count towards the rate limit)
+        if not is_cached(session, payload):
+            wait_for_turn()
+        resp = session.post(BASE, data=payload, headers=FORM_HEADERS, timeout=20)
 
-        # send the data to the site
-        resp = session.post(BASE, data=payload, headers=headers, timeout=20)
-        resp.encoding = "utf-8"
+        # a server error, or a page without new tokens, means our tokens were not accepted
+        # (the status is checked first: an error page can be empty and can't be parsed)
+        fields = read_page(resp.content) if resp.status_code < 500 else None
+        if not fields or not (fields["__VIEWSTATE"] and fields["__EVENTVALIDATION"]):
+            result = {"Roll No": roll_no, "Name": "",
+                      "Result": f"Error: request was rejected (HTTP {resp.status_code})"}
+            return result, "", ""
 
-        # parse the response page
-        soup = BeautifulSoup(resp.text, "lxml")
+        # the response carries new tokens for the next request
+        viewstate, eventvalidation = fields["__VIEWSTATE"], fields["__EVENTVALIDATION"]
 
         # check if the site gave an error message (invalid roll number, etc.)
-        err = soup.select_one("#LblErr")
-        if err and err.get_text(strip=True):
-            return {"Roll No": roll_no, "Name": "", "Result": err.get_text(strip=True)}
+        err = fields["LblErr"]
+        if err:
+            result = {"Roll No": roll_no, "Name": "", "Result": err}
+            return result, viewstate, eventvalidation
 
         # extract the student's name
-        name_tag = soup.select_one("#LblName")
-        name = name_tag.get_text(strip=True) if name_tag else ""
+        name = fields["LblName"]
 
         # extract the roll number shown on the page
-        roll_tag = soup.select_one("#LblRollNo")
-        roll_on_page = roll_tag.get_text(strip=True) if roll_tag else str(roll_no)
+        roll_on_page = fields["LblRollNo"] or str(roll_no)
 
-        # extract the result or marks
-        res_tag = soup.select_one("#lblGazres")
-        final_result = res_tag.get_text(strip=True) if res_tag else ""
+        # extract the result or marks (and split it into status and marks)
+        final_result = fields["lblGazres"]
+        status, marks = split_result(final_result)
 
         # return the collected data
-        return {
+        result = {
             "Roll No": roll_on_page,
             "Name": name,
-            "Result": final_result
+            "Result": final_result,
+            "Status": status,
+            "Marks": marks,
         }
+        return result, viewstate, eventvalidation
 
     except Exception as e:
-        # if something goes wrong, return an error message
-        return {"Roll No": roll_no, "Name": "", "Result": f"Error: {e}"}
+        # if something goes wrong, return an error message (and the old tokens)
+        return {"Roll No": roll_no, "Name": "", "Result": f"Error: {e}"}, viewstate, eventvalidation
+
+
+# every worker thread keeps its own chain of tokens in here
+_thread_tokens = threading.local()
+
+def fetch_roll_in_thread(session, roll_no):
+    """
+    Same as fetch_one_roll, but safe to run from many threads at once.
+    Each thread gets its starting tokens from fetch_start_tokens the first time it runs,
+    then keeps passing the fresh tokens from every response to its next roll number.
+    If the website stops accepting the tokens, fresh ones are fetched and the roll number is tried once more.
+    """
+    for attempt in range(2):
+        if not getattr(_thread_tokens, "viewstate", None):
+            try:
+                # get a starting set of tokens for this thread
+                _thread_tokens.viewstate, _thread_tokens.eventvalidation = fetch_start_tokens(session)
+            except Exception as e:
+                return {"Roll No": roll_no, "Name": "", "Result": f"Error: {e}"}
+
+        data, _thread_tokens.viewstate, _thread_tokens.eventvalidation = fetch_one_roll(
+            session, roll_no, _thread_tokens.viewstate, _thread_tokens.eventvalidation
+        )
+        if _thread_tokens.viewstate:
+            return data
+
+        # the tokens were not accepted: throw the saved ones away and try again
+        forget_start_tokens()
+
+    return data
 
 
 # -------------------------------------------------------------
-# STEP 3: SAVE RESULTS TO A PDF
+# STEP 3: SAVE RESULTS TO A CSV FILE AS THEY ARRIVE
 # -------------------------------------------------------------
-from reportlab.lib.pagesizes import A4, landscape
-from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Spacer, Paragraph
-from reportlab.lib.styles import getSampleStyleSheet
-from reportlab.lib import colors
+def load_done_rolls(filename=RESULTS_CSV):
+    """
+    Returns the set of roll numbers that are already saved in the CSV file,
+    so they can be skipped when the script is run again.
+    """
+    if not os.path.exists(filename):
+        return set()
+    with open(filename, newline="", encoding="utf-8") as f:
+        return {int(row["Roll No"]) for row in csv.DictReader(f)}
 
-def save_summary_pdf(data_list, filename="bise_results_summary.pdf"):
+
+def open_results_csv(filename=RESULTS_CSV):
     """
-    Takes a list of dictionaries (with Roll No, Name, and Result)
-    and saves them into a neat PDF table for easy viewing.
+    Opens the CSV file for adding new results (and writes the header row if the file is new or empty,
+    e.g. because an earlier run was stopped before it saved anything).
+    Returns the open file and a csv writer for it.
+    If the file was made by an older version of this script with fewer columns,
+    new rows keep using those columns so the file stays readable.
     """
-    styles = getSampleStyleSheet()
-    doc = SimpleDocTemplate(filename, pagesize=landscape(A4))
-    elements = []
+    fieldnames = CSV_FIELDS
+    is_new = not os.path.exists(filename) or os.path.getsize(filename) == 0
+    if not is_new:
+        with open(filename, newline="", encoding="utf-8") as f:
+            fieldnames = next(csv.reader(f), None) or CSV_FIELDS
 
-    # title of the PDF
-    elements.append(Paragraph("BISE Sargodha Exam Results (Summary)", styles['Title']))
-    elements.append(Spacer(1, 20))  # space under the title
+    f = open(filename, "a", newline="", encoding="utf-8")
+    writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction="ignore")
+    if is_new:
+        writer.writeheader()
+    return f, writer
 
-    # create table header
-    rows = [["Roll No", "Name", "Final Result"]]
 
-    # add each student's data to the table
-    for entry in data_list:
-        rows.append([
-            entry.get("Roll No", ""),
+def read_saved_results(filename=RESULTS_CSV, first_roll=None, last_roll=None):
+    """
+    Reads the saved results back from the CSV file, sorted by roll number
+    (optionally only the roll numbers from first_roll to last_roll).
+    A resumed run adds the roll numbers that failed earlier at the end of the file,
+    so the rows are sorted here to keep the Excel file and PDF in roll number order.
+    """
+    rows = []
+    with open(filename, newline="", encoding="utf-8") as f:
+        for row in csv.DictReader(f):
+            roll_no = int(row["Roll No"])
+            if first_roll is not None and roll_no < first_roll:
+                continue
+            if last_roll is not None and roll_no > last_roll:
+                continue
+            rows.append(row)
+
+    rows.sort(key=lambda row: int(row["Roll No"]))
+    return rows
+
+
+# -------------------------------------------------------------
+# STEP 4: SAVE RESULTS TO AN EXCEL FILE
+# -------------------------------------------------------------
+def save_summary_xlsx(data_list, filename="bise_results.xlsx"):
+    """
+    Takes a list (or any other sequence, like read_saved_results) of dictionaries
+    (with Roll No, Name, Result, Status and Marks) and saves them into an Excel file.
+
+    The file is written in "constant memory" mode: every row goes straight to disk,
+    so this stays fast and small even for a huge roll number range.
+    """
+    workbook = xlsxwriter.Workbook(filename, {"constant_memory": True})
+    worksheet = workbook.add_worksheet("Results")
+    bold = workbook.add_format({"bold": True})
+
+    # header row, and some nice column widths
+    worksheet.write_row(0, 0, CSV_FIELDS, bold)
+    worksheet.set_column(0, 0, 12)
+    worksheet.set_column(1, 1, 30)
+    worksheet.set_column(2, 3, 35)
+    worksheet.set_column(4, 4, 8)
+
+    # one row per student (roll numbers and marks are saved as numbers, so Excel can sort them)
+    for i, entry in enumerate(data_list, 1):
+        roll_no = str(entry.get("Roll No", ""))
+        marks = entry.get("Marks")
+        worksheet.write_row(i, 0, [
+            int(roll_no) if roll_no.isdigit() else roll_no,
             entry.get("Name", ""),
             entry.get("Result", ""),
+            entry.get("Status") or "",
+            int(marks) if marks not in (None, "") else "",
         ])
 
+    workbook.close()
+    log.info("✅ Excel file saved: %s", filename)
+
+
+# -------------------------------------------------------------
+# STEP 5: SAVE RESULTS TO A PDF (optional, use --pdf)
+# -------------------------------------------------------------
+PDF_HEADER = ["Roll No", "Name", "Final Result"]
+
+def save_summary_pdf(data_list, filename="bise_results_summary.pdf"):
+    """
+    Takes a list (or any other sequence, like read_saved_results) of dictionaries
+    (with Roll No, Name, and Result) and saves them into a neat PDF table for easy viewing.
+
+    All students go into one LongTable, which is quicker than a normal Table at splitting
+    a long list across pages, and repeats the header row at the top of every page.
+    The whole table is still kept in memory until the PDF is finished, so for very large
+    roll number ranges the Excel file is the better choice.
+    Needs 'reportlab' (only loaded when a PDF is actually made).
+    """
+    from reportlab.lib.pagesizes import A4, landscape
+    from reportlab.platypus import SimpleDocTemplate, LongTable, TableStyle, Spacer, Paragraph
+    from reportlab.lib.styles import getSampleStyleSheet
+    from reportlab.lib import colors
+
     # style the table to look nice
-    table = Table(rows, colWidths=[100, 180, 250])
-    table.setStyle(TableStyle([
+    table_style = TableStyle([
         ("BACKGROUND", (0,0), (-1,0), colors.darkblue),  # dark blue header
         ("TEXTCOLOR",(0,0),(-1,0),colors.whitesmoke),   # white header text
         ("ALIGN",(0,0),(-1,-1),"CENTER"),               # center align text
@@ -162,36 +552,85 @@ def save_summary_pdf(data_list, filename="bise_results_summary.pdf"):
         ("ROWBACKGROUNDS", (0,1), (-1,-1), [colors.whitesmoke, colors.lightgrey]), # alternating colors
         ("GRID", (0,0), (-1,-1), 0.5, colors.black),    # table borders
         ("BOTTOMPADDING", (0,0), (-1,0), 8),            # extra padding under header
-    ]))
+    ])
+
+    styles = getSampleStyleSheet()
+    doc = SimpleDocTemplate(filename, pagesize=landscape(A4))
+    elements = []
+
+    # title of the PDF
+    elements.append(Paragraph("BISE Sargodha Exam Results (Summary)", styles['Title']))
+    elements.append(Spacer(1, 20))  # space under the title
+
+    # create table header, then add each student's data to the table
+    rows = [PDF_HEADER]
+    for entry in data_list:
+        rows.append([
+            entry.get("Roll No", ""),
+            entry.get("Name", ""),
+            entry.get("Result", ""),
+        ])
+
+    table = LongTable(rows, colWidths=[100, 180, 250], repeatRows=1)
+    table.setStyle(table_style)
 
     elements.append(table)
     doc.build(elements)
-    print(f"✅ PDF saved: {filename}")
+    log.info("✅ PDF saved: %s", filename)
 
 
 # -------------------------------------------------------------
-# STEP 4: MAIN SCRIPT
+# STEP 6: MAIN SCRIPT
 # -------------------------------------------------------------
 # Change these numbers to the roll number range you want to check
 start_roll = 123456  # first roll number
 end_roll = 123456   # last roll number
 
-# empty list to store all student data
-results = []
+# run with "--pdf" to also make the PDF summary (slower and uses more memory for big ranges)
+parser = argparse.ArgumentParser(description="BISE Sargodha result scraper")
+parser.add_argument("--pdf", action="store_true", help="also save the results as a PDF table")
+args = parser.parse_args()
 
-# create a session (keeps cookies and speeds up requests)
-with requests.Session() as session:
-    for rn in range(start_roll, end_roll + 1):
-        print(f"Fetching result for Roll No: {rn}...")  # show progress
-        data = fetch_one_roll(session, rn)              # get data for one student
-        print(data)                                     # print to console
-        results.append(data)                            # save in list
+# print progress messages to the console
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+
+# skip the roll numbers we already saved in an earlier run
+done_rolls = load_done_rolls()
+todo_rolls = [rn for rn in range(start_roll, end_roll + 1) if rn not in done_rolls]
+if done_rolls:
+    log.info("Skipping %d roll numbers already saved in %s", end_roll - start_roll + 1 - len(todo_rolls), RESULTS_CSV)
 
-# once all results are collected, save them to a PDF
-save_summary_pdf(results, "bise_results_summary.pdf")
+# create a session (keeps cookies and speeds up requests)
+csv_file, csv_writer = open_results_csv()
+with csv_file, make_session() as session, ThreadPoolExecutor(max_workers=WORKERS) as executor:
+    log.info("Fetching results for Roll No %d to %d (%d at a time)...", start_roll, end_roll, WORKERS)
+
+    # executor.map runs the requests at the same time, but gives the results back
+    # in roll number order (within one run; read_saved_results sorts the whole file again)
+    results = executor.map(lambda rn: fetch_roll_in_thread(session, rn), todo_rolls)
+    for done, (rn, data) in enumerate(zip(todo_rolls, results), 1):
+        # only show progress every PROGRESS_EVERY roll numbers (printing every line slows things down)
+        if done % PROGRESS_EVERY == 0 or done == len(todo_rolls):
+            log.info("%d/%d done (Roll No %s -> %s)", done, len(todo_rolls), rn, data["Result"])
+
+        # network errors are not saved, so the next run tries those roll numbers again
+        if str(data["Result"]).startswith("Error:"):
+            log.warning("Roll No %s: %s", rn, data["Result"])
+            continue
+
+        # save this result to the CSV file straight away
+        csv_writer.writerow({**data, "Roll No": rn})
+        csv_file.flush()
+
+# once all results are saved, turn them into an Excel file (and a PDF, if asked for)
+save_summary_xlsx(read_saved_results(first_roll=start_roll, last_roll=end_roll), "bise_results.xlsx")
+if args.pdf:
+    save_summary_pdf(read_saved_results(first_roll=start_roll, last_roll=end_roll), "bise_results_summary.pdf")
 
 # -------------------------------------------------------------
 # NOTE:
-# If 'reportlab' is not installed, install it by running:
+# If 'xlsxwriter' is not installed, install it by running:
+#    pip install xlsxwriter
+# For the --pdf option, 'reportlab' is also needed:
 #    pip install reportlab
 # -------------------------------------------------------------